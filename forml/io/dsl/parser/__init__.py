@@ -22,7 +22,6 @@ import abc
 import collections
 import functools
 import logging
-import types
 import typing
 
 from forml.io.dsl import error
@@ -42,12 +41,18 @@ class Container(typing.Generic[Symbol]):
     depletion on exit.
     """
 
+    __slots__ = ('_context', '_stack')
+
     class Context:
         """Storage context."""
 
+        __slots__ = ('symbols',)
+
         class Symbols:
             """Stack for parsed symbols."""
 
+            __slots__ = ('_stack',)
+
             def __init__(self):
                 self._stack: typing.List[Symbol] = list()
 
@@ -72,6 +77,23 @@ class Container(typing.Generic[Symbol]):
                     raise RuntimeError('Empty context')
                 return self._stack.pop()
 
+            def pull(self, count: int) -> typing.Sequence[Symbol]:
+                """Remove and return the given number of values from the top of the stack (in their original order).
+
+                Args:
+                    count: Number of items to be removed.
+
+                Returns:
+                    Items from the stack top.
+                """
+                if not count:
+                    return []
+                if len(self._stack) < count:
+                    raise RuntimeError('Empty context')
+                items = self._stack[-count:]
+                del self._stack[-count:]
+                return items
+
         def __init__(self):
             self.symbols: Container.Context.Symbols = self.Symbols()
 
@@ -121,59 +143,16 @@ class Container(typing.Generic[Symbol]):
         return symbol
 
 
-def bypass(override: typing.Callable[[Container, typing.Any], Source]) -> typing.Callable:
-    """Bypass the (result of) the particular visit_* implementation if the supplied override resolver provides an
-    alternative value.
-
-    Args:
-        override: Callable resolver that returns an explicit value for given subject or raises KeyError for unknown
-        mapping.
-
-    Returns:
-        Visitor method decorator.
-    """
-
-    def decorator(method: typing.Callable[[Container, typing.Any], typing.ContextManager[None]]) -> typing.Callable:
-        """Visitor method decorator with added bypassing capability.
-
-        Args:
-            method: Visitor method to be decorated.
-
-        Returns:
-            Decorated version of the visit_* method.
-        """
-
-        @functools.wraps(method)
-        def wrapped(self: Container, subject: typing.Any) -> None:
-            """Decorated version of the visit_* method.
-
-            Args:
-                self: Visitor instance.
-                subject: Visited subject.
-            """
-            method(self, subject)
-            try:
-                new = override(self, subject)
-            except error.Mapping:
-                pass
-            else:
-                old = self.context.symbols.pop()
-                LOGGER.debug('Overriding result for %s (%s -> %s)', subject, old, new)
-                self.context.symbols.push(new)
-
-        return wrapped
-
-    return decorator
-
-
 class Columnar(
     typing.Generic[Source, Column], Container[typing.Union[Source, Column]], visit.Columnar, metaclass=abc.ABCMeta
 ):
     """Base parser class for both Frame and Series visitors."""
 
+    __slots__ = ('_sources',)
+
     def __init__(self, sources: typing.Mapping[frame.Source, Source]):
         super().__init__()
-        self._sources: typing.Mapping[frame.Source, Source] = types.MappingProxyType(sources)
+        self._sources: typing.Mapping[frame.Source, Source] = sources  # not to be mutated
 
     @abc.abstractmethod
     def generate_column(self, column: sermod.Column) -> Column:
@@ -204,14 +183,19 @@ class Columnar(
 class Frame(typing.Generic[Source, Column], Columnar[Source, Column], visit.Frame, metaclass=abc.ABCMeta):
     """Frame source parser."""
 
+    __slots__ = ('_series',)
+
     class Series(typing.Generic[Source, Column], Columnar[Source, Column], visit.Series, metaclass=abc.ABCMeta):
         """Series column parser."""
 
+        __slots__ = ('_columns', '_cache')
+
         def __init__(
             self, sources: typing.Mapping[frame.Source, Source], columns: typing.Mapping[sermod.Column, Column]
         ):
             super().__init__(sources)
-            self._columns: typing.Mapping[sermod.Column, Column] = types.MappingProxyType(columns)
+            self._columns: typing.Mapping[sermod.Column, Column] = columns  # not to be mutated
+            self._cache: typing.Dict[sermod.Column, Column] = dict()
 
         def resolve_column(self, column: sermod.Column) -> Column:
             """Get a custom target code for a column value.
@@ -227,19 +211,43 @@ class Frame(typing.Generic[Source, Column], Columnar[Source, Column], visit.Fram
             except KeyError as err:
                 raise error.Mapping(f'Unknown mapping for column {column}') from err
 
-        @functools.lru_cache()
         def generate_column(self, column: sermod.Column) -> Column:
             """Generate target code for the generic column type.
 
+            Instead of the recursive visitor protocol, the column tree is traversed iteratively (post-order) with each
+            node processed by the handler registered for its type. Results of all the (sub)columns are cached per
+            parser instance using the (structural) column hash so that repeated occurrences of the same (sub)column
+            (ie within the selection, filters, grouping or ordering) are only processed once.
+
             Args:
                 column: Column instance
 
             Returns:
                 Column in target code.
             """
-            with self as visitor:
-                column.accept(visitor)
-                return visitor.fetch()
+            if column not in self._cache:
+                with self as visitor:
+                    symbols = visitor.context.symbols
+                    pending: typing.List[typing.Tuple[sermod.Column, typing.Optional[int]]] = [(column, None)]
+                    while pending:
+                        node, arity = pending.pop()
+                        if node in self._cache:
+                            symbols.push(self._cache[node])
+                            continue
+                        handler = self._handler(type(node))
+                        if handler is None:  # unknown column type - falling back to the visitor protocol
+                            node.accept(visitor)
+                        elif arity is None:
+                            operands = handler.operands(self, node)
+                            pending.append((node, len(operands)))
+                            pending.extend((o, None) for o in reversed(operands))
+                            continue
+                        else:
+                            symbols.push(handler.generate(self, node, symbols.pull(arity)))
+                        self._cache[node] = symbols.pop()
+                        symbols.push(self._cache[node])
+                    self._cache[column] = visitor.fetch()
+            return self._cache[column]
 
         @abc.abstractmethod
         def generate_reference(self, name: str) -> Column:
@@ -322,35 +330,137 @@ class Frame(typing.Generic[Source, Column], Columnar[Source, Column], visit.Fram
             self.context.symbols.push(self.generate_reference(origin.name))
 
         def visit_aliased(self, column: sermod.Aliased) -> None:
-            super().visit_aliased(column)
-            self.context.symbols.push(self.generate_alias(self.context.symbols.pop(), column.name))
+            self.context.symbols.push(self.generate_column(column))
 
         def visit_literal(self, column: sermod.Literal) -> None:
-            super().visit_literal(column)
-            self.context.symbols.push(self.generate_literal(column.value, column.kind))
+            self.context.symbols.push(self.generate_column(column))
 
         def visit_element(self, column: sermod.Element) -> None:
-            super().visit_element(column)
-            self.context.symbols.push(self.generate_element(self.context.symbols.pop(), self.resolve_column(column)))
+            self.context.symbols.push(self.generate_column(column))
 
-        @bypass(resolve_column)
         def visit_expression(self, column: sermod.Expression) -> None:
-            super().visit_expression(column)
-            arguments = tuple(
-                reversed([self.context.symbols.pop() if isinstance(c, sermod.Column) else c for c in reversed(column)])
-            )
-            self.context.symbols.push(self.generate_expression(column.__class__, arguments))
+            self.context.symbols.push(self.generate_column(column))
+
+        def visit_window(self, column: sermod.Window) -> None:
+            self.context.symbols.push(self.generate_column(column))
+
+        class Handler(typing.NamedTuple):
+            """Column type handler used by the iterative traversal made of a function returning the column operands
+            to be generated prior to the column itself (or directly caching the column result if it can be resolved
+            without generating) and a function generating the column from the already generated operands.
+            """
+
+            operands: typing.Callable[['Frame.Series', sermod.Column], typing.Sequence[sermod.Column]]
+            generate: typing.Callable[['Frame.Series', sermod.Column, typing.Sequence[Column]], Column]
+
+        def _generate_aliased(self, column: sermod.Aliased, operands: typing.Sequence[Column]) -> Column:
+            """Generate target code for the aliased column.
+
+            Args:
+                column: Aliased column instance.
+                operands: Already generated operable column.
+
+            Returns:
+                Aliased column in target code.
+            """
+            return self.generate_alias(operands[0], column.name)
+
+        def _generate_literal(self, column: sermod.Literal, _: typing.Sequence[Column]) -> Column:
+            """Generate target code for the literal column.
+
+            Args:
+                column: Literal column instance.
+
+            Returns:
+                Literal in target code.
+            """
+            return self.generate_literal(column.value, column.kind)
+
+        def _generate_element(self, column: sermod.Element, _: typing.Sequence[Column]) -> Column:
+            """Generate target code for the element column (including its origin).
+
+            Args:
+                column: Element column instance.
+
+            Returns:
+                Element in target code.
+            """
+            column.origin.accept(self)
+            return self.generate_element(self.context.symbols.pop(), self.resolve_column(column))
+
+        def _expression_operands(self, column: sermod.Expression) -> typing.Sequence[sermod.Column]:
+            """Get the expression operands to be generated prior to the expression itself.
+
+            Args:
+                column: Expression column instance.
+
+            Returns:
+                Column arguments of the expression or empty list if the expression is explicitly mapped.
+            """
+            try:  # explicitly mapped expression goes straight to the cache bypassing its own generation
+                self._cache[column] = self.resolve_column(column)
+                return []
+            except error.Mapping:
+                return [t for t, c in zip(column, column.mask) if c]
+
+        def _generate_expression(self, column: sermod.Expression, operands: typing.Sequence[Column]) -> Column:
+            """Generate target code for the expression column.
 
-        @bypass(resolve_column)
-        def visit_window(self, column: sermod.Window) -> typing.ContextManager[None]:
+            Args:
+                column: Expression column instance.
+                operands: Already generated column arguments of the expression.
+
+            Returns:
+                Expression in target code.
+            """
+            operands = iter(operands)
+            arguments = tuple(next(operands) if c else t for t, c in zip(column, column.mask))
+            return self.generate_expression(column.__class__, arguments)
+
+        def _window_operands(  # pylint: disable=no-self-use
+            self, column: sermod.Window
+        ) -> typing.Sequence[sermod.Column]:
+            """Get the window operands to be generated prior to the window itself (not yet supported).
+
+            Args:
+                column: Window column instance.
+            """
             raise NotImplementedError('Window functions not yet supported')
 
+        HANDLERS: typing.Mapping[typing.Type[sermod.Column], 'Frame.Series.Handler'] = {
+            sermod.Aliased: Handler(lambda _, c: [c.operable], _generate_aliased),
+            sermod.Literal: Handler(lambda _, c: [], _generate_literal),
+            sermod.Element: Handler(lambda _, c: [], _generate_element),
+            sermod.Window: Handler(_window_operands, None),
+            sermod.Expression: Handler(_expression_operands, _generate_expression),
+        }
+
+        @classmethod
+        @functools.lru_cache()
+        def _handler(cls, kind: typing.Type[sermod.Column]) -> typing.Optional['Frame.Series.Handler']:
+            """Resolve the handler for the given column type based on its MRO.
+
+            Args:
+                kind: Column type.
+
+            Returns:
+                Handler instance or None if not registered.
+            """
+            for base in kind.__mro__:
+                if base in cls.HANDLERS:
+                    return cls.HANDLERS[base]
+            return None
+
     class Context(Container.Context):
         """Extended container context for holding the segments."""
 
+        __slots__ = ('tables',)
+
         class Tables:
             """Container for segments of all tables."""
 
+            __slots__ = ('_segments',)
+
             class Segment(collections.namedtuple('Segment', 'fields, factors')):
                 """Frame segment specification as a list of columns (vertical) and row predicates (horizontal)."""
 
@@ -410,19 +520,18 @@ class Frame(typing.Generic[Source, Column], Columnar[Source, Column], visit.Fram
         super().__init__(sources)
         self._series: Frame.Series = self.Series(sources, columns)  # pylint: disable=abstract-class-instantiated
 
-    @functools.lru_cache()
     def generate_column(self, column: sermod.Column) -> Column:
         """Generate target code for the generic column type.
 
+        Delegated to the series parser which is caching the results.
+
         Args:
             column: Column instance
 
         Returns:
             Column in target code.
         """
-        with self._series as visitor:
-            column.accept(visitor)
-            return visitor.fetch()
+        return self._series.generate_column(column)
 
     @abc.abstractmethod
     def generate_reference(self, instance: Source, name: str) -> Source:
@@ -521,8 +630,10 @@ class Frame(typing.Generic[Source, Column], Columnar[Source, Column], visit.Fram
         super().visit_reference(origin)
         self.context.symbols.push(self.generate_reference(self.context.symbols.pop(), origin.name))
 
-    @bypass(Columnar.resolve_source)
     def visit_join(self, source: frame.Join) -> None:
+        if source in self._sources:
+            self.context.symbols.push(self._sources[source])
+            return
         if source.condition:
             self.context.tables.filter(source.condition)
         super().visit_join(source)
@@ -531,15 +642,19 @@ class Frame(typing.Generic[Source, Column], Columnar[Source, Column], visit.Fram
         expression = self.generate_column(source.condition) if source.condition is not None else None
         self.context.symbols.push(self.generate_join(left, right, expression, source.kind))
 
-    @bypass(Columnar.resolve_source)
     def visit_set(self, source: frame.Set) -> None:
+        if source in self._sources:
+            self.context.symbols.push(self._sources[source])
+            return
         super().visit_set(source)
         right = self.context.symbols.pop()
         left = self.context.symbols.pop()
         self.context.symbols.push(self.generate_set(left, right, source.kind))
 
-    @bypass(Columnar.resolve_source)
     def visit_query(self, source: frame.Query) -> None:
+        if source in self._sources:
+            self.context.symbols.push(self._sources[source])
+            return
         with self:
             self.context.tables.select(*source.columns)
             if source.prefilter is not None:
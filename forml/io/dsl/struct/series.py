@@ -487,7 +487,18 @@ class Field(Element):
 
 
 class Expression(Operable, metaclass=abc.ABCMeta):  # pylint: disable=abstract-method
-    """Base class for expressions."""
+    """Base class for expressions.
+
+    Apart from the actual expression terms, each instance carries a mask precomputed at construction time telling which
+    of its terms are columns (as opposed to plain values).
+    """
+
+    mask: typing.Tuple[bool, ...]
+
+    def __new__(cls, *args):
+        instance = super().__new__(cls, *args)
+        instance.mask = tuple(isinstance(a, Column) for a in args)
+        return instance
 
     @property
     def name(self) -> None:
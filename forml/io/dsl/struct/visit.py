@@ -20,15 +20,15 @@ Schema visitor APIs.
 import abc
 import typing
 
-from forml.io.dsl.struct import series
-
 if typing.TYPE_CHECKING:
-    from forml.io.dsl.struct import frame
+    from forml.io.dsl.struct import frame, series
 
 
 class Columnar(metaclass=abc.ABCMeta):
     """Base class for both Frame and Series visitors."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def visit_table(self, origin: 'frame.Table') -> None:
         """Table hook.
@@ -49,6 +49,8 @@ class Columnar(metaclass=abc.ABCMeta):
 class Frame(Columnar):
     """Frame visitor."""
 
+    __slots__ = ()
+
     def visit_source(self, source: 'frame.Source') -> None:  # pylint: disable=unused-argument, no-self-use
         """Generic source hook.
 
@@ -106,6 +108,8 @@ class Frame(Columnar):
 class Series(Columnar):
     """Series visitor."""
 
+    __slots__ = ()
+
     def visit_origin(self, origin: 'frame.Origin') -> None:  # pylint: disable=unused-argument, no-self-use
         """Tangible source hook.
 
@@ -168,8 +172,8 @@ class Series(Columnar):
         Args:
             column: Expression instance to be visited.
         """
-        for term in column:
-            if isinstance(term, series.Column):
+        for term, operand in zip(column, column.mask):
+            if operand:
                 term.accept(self)
         self.visit_column(column)
 
@@ -19,6 +19,7 @@
 Extract utilities.
 """
 import abc
+import collections
 import logging
 import typing
 
@@ -128,7 +129,13 @@ class Operator(topology.Operator):
 
 
 class Reader(typing.Generic[parsmod.Source, parsmod.Column, payload.Native], metaclass=abc.ABCMeta):
-    """Base class for reader implementation."""
+    """Base class for reader implementation.
+
+    The parsed statements are cached by the (structural) query identity so that repeated executions of the same query
+    don't have to go through the parser again.
+    """
+
+    CACHESIZE = 16
 
     class Actor(task.Actor):
         """Data extraction actor using the provided reader and statement to load the data."""
@@ -152,17 +159,36 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Column, payload.Native], met
         self._sources: typing.Mapping[frame.Source, parsmod.Source] = sources
         self._columns: typing.Mapping[series.Column, parsmod.Column] = columns
         self._kwargs: typing.Mapping[str, typing.Any] = kwargs
+        self._statements: typing.OrderedDict[frame.Query, parsmod.Source] = collections.OrderedDict()
 
     def __repr__(self):
         return task.name(self.__class__, **self._kwargs)
 
     def __call__(self, query: frame.Query) -> payload.ColumnMajor:
+        result = self.compile(query)
+        LOGGER.debug('Starting ETL read using: %s', result)
+        return self.format(self.read(result, **self._kwargs))
+
+    def compile(self, query: frame.Query) -> parsmod.Source:
+        """Parse the query into the reader's native syntax (or get it from the cache if parsed previously).
+
+        Args:
+            query: Query to be parsed.
+
+        Returns:
+            Query statement in the reader's native syntax.
+        """
+        if query in self._statements:
+            self._statements.move_to_end(query)
+            return self._statements[query]
         LOGGER.debug('Parsing ETL query')
         with self.parser(self._sources, self._columns) as visitor:
             query.accept(visitor)
             result = visitor.fetch()
-        LOGGER.debug('Starting ETL read using: %s', result)
-        return self.format(self.read(result, **self._kwargs))
+        self._statements[query] = result
+        if len(self._statements) > self.CACHESIZE:
+            self._statements.popitem(last=False)
+        return result
 
     @classmethod
     @abc.abstractmethod
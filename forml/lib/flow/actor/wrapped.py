@@ -27,6 +27,11 @@ import typing
 from forml import error
 from forml.flow import task
 
+TRAIN: str = task.Actor.train.__name__
+METHODS: typing.Tuple[str, ...] = tuple(
+    m.__name__ for m in (task.Actor.apply, task.Actor.train, task.Actor.get_params, task.Actor.set_params)
+)
+
 
 class Wrapping(metaclass=abc.ABCMeta):
     """Base class for wrappers."""
@@ -75,7 +80,7 @@ class Mapping(Wrapping):
         Returns:
             True if the wrapped actor is stateful (has a train method).
         """
-        return hasattr(self._actor, self._params[task.Actor.train.__name__])
+        return hasattr(self._actor, self._params[TRAIN])
 
 
 class Class(Mapping):
@@ -95,13 +100,27 @@ class Class(Mapping):
             return self._actor, self._params
 
         def __getattribute__(self, item):
-            if item.startswith('_') or item not in self._params and not hasattr(self._actor, item):
+            if item.startswith('_'):
+                return super().__getattribute__(item)
+            # fetching the internals directly to avoid recursing into this method
+            actor = super().__getattribute__('_actor')
+            params = super().__getattribute__('_params')
+            if item in params:
+                return getattr(actor, params[item])
+            try:
+                return getattr(actor, item)
+            except AttributeError:
                 return super().__getattribute__(item)
-            return getattr(self._actor, self._params.get(item, item))
 
     def __init__(self, actor: typing.Type, params: typing.Mapping[str, str]):
         assert not issubclass(actor, task.Actor), 'Wrapping a true actor'
         super().__init__(actor, params)
+        # the decorator wrapping is immutable (unlike the actor instances whose __dict__ is their persistent state)
+        self._hash: int = super().__hash__()
+        self._stateful: bool = super().is_stateful()
+
+    def __hash__(self):
+        return self._hash
 
     def __call__(self, *args, **kwargs) -> task.Actor:
         return self.Actor(self._actor(*args, **kwargs), self._params)  # pylint: disable=abstract-class-instantiated
@@ -109,6 +128,14 @@ class Class(Mapping):
     def __repr__(self):
         return task.name(self._actor)
 
+    def is_stateful(self) -> bool:
+        """Emulation of native actor is_stateful class method.
+
+        Returns:
+            True if the wrapped actor is stateful (has a train method).
+        """
+        return self._stateful
+
     @staticmethod
     def actor(  # pylint: disable=bad-staticmethod-argument
         cls: typing.Optional[typing.Type] = None, /, **mapping: str
@@ -129,16 +156,18 @@ class Class(Mapping):
         if not all(isinstance(a, str) for a in mapping.values()):
             raise ValueError('Invalid mapping')
 
-        for method in (task.Actor.apply, task.Actor.train, task.Actor.get_params, task.Actor.set_params):
-            mapping.setdefault(method.__name__, method.__name__)
+        for method in METHODS:
+            mapping.setdefault(method, method)
+
+        required = {t for s, t in mapping.items() if s != TRAIN}
 
         def decorator(cls) -> typing.Type[task.Actor]:
             """Decorating function."""
-            if not inspect.isclass(cls):
+            if not isinstance(cls, type):
                 raise ValueError(f'Invalid actor class {cls}')
             if issubclass(cls, task.Actor):
                 return cls
-            for target in {t for s, t in mapping.items() if s != task.Actor.train.__name__}:
+            for target in required:
                 if not callable(getattr(cls, target, None)):
                     raise error.Missing(f'Wrapped actor missing required {target} implementation')
             return Class(cls, mapping)
@@ -205,6 +234,12 @@ class Function(Wrapping):
         if not inspect.isfunction(function):
             raise ValueError(f'Invalid actor function {function}')
         super().__init__(function, params)
+        self._hash: typing.Optional[int] = None
+
+    def __hash__(self):
+        if self._hash is None:  # computed lazily as the params might not be hashable
+            self._hash = super().__hash__()
+        return self._hash
 
     def __call__(self, *args, **kwargs) -> 'Function.Actor':
         return self.Actor(self._actor, *args, **{**self._params, **kwargs})
@@ -34,6 +34,8 @@ class Crossvalidated(topology.Operator, metaclass=abc.ABCMeta):
     class Builder(metaclass=abc.ABCMeta):
         """Crossvalidation builder used as a folding context."""
 
+        __slots__ = ()
+
         @abc.abstractmethod
         def build(self) -> pipeline.Segment:
             """Builder finalize method.
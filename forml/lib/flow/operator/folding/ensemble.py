@@ -20,7 +20,9 @@ Ensembling operators.
 """
 
 import typing
+import warnings
 
+import numpy
 import pandas
 from pandas.core import generic as pdtype
 from sklearn import model_selection
@@ -38,6 +40,8 @@ class FullStacker(folding.Crossvalidated):
     class Builder(folding.Crossvalidated.Builder):
         """Crossvalidation builder used as a folding context."""
 
+        __slots__ = ('head', 'stackers', 'mergers', 'trained', 'applied')
+
         def __init__(
             self,
             head: pipeline.Segment,
@@ -81,14 +85,28 @@ class FullStacker(folding.Crossvalidated):
         """
         if not (folds and all(f.shape == folds[0].shape for f in folds)):
             raise ValueError('Folds must have same shape')
-        folds = (
-            [([f.name for f in folds], folds)]
-            if folds[0].ndim == 1
-            else (zip(*i) for i in zip(*(f.iteritems() for f in folds)))
-        )
-        return pandas.concat(
-            (pandas.concat(s, axis='columns').mean(axis='columns').rename(n[0]) for n, s in folds), axis='columns'
+        head = folds[0]
+        values = [f.to_numpy() for f in folds]
+        sources = [numpy.result_type(*c) for c in zip(*([f.dtype] if f.ndim == 1 else f.dtypes for f in folds))]
+        # output type of each column - floating inputs keep their precision, any other gets averaged to double
+        dtypes = [d if numpy.issubdtype(d, numpy.floating) else numpy.dtype(numpy.float64) for d in sources]
+        dtype = numpy.result_type(*dtypes)
+        if dtype == numpy.float64 and all(numpy.issubdtype(d, numpy.floating) for d in sources):
+            dtype = numpy.dtype(numpy.float32)  # single precision is sufficient for averaging double predictions
+        # single buffer holding all the folds in the accumulation precision
+        buffer = numpy.empty((len(values), *head.shape), dtype=dtype)
+        for index, value in enumerate(values):
+            buffer[index] = value
+        merged = numpy.empty(head.shape, dtype=dtype)
+        with warnings.catch_warnings():  # all-NaN slices are expected to just produce NaNs
+            warnings.simplefilter('ignore', RuntimeWarning)
+            numpy.nanmean(buffer, axis=0, out=merged)
+        merged = merged.reshape(len(head), -1)
+        output = pandas.DataFrame(
+            {i: merged[:, i].astype(d, copy=False) for i, d in enumerate(dtypes)}, index=head.index
         )
+        output.columns = [head.name] if head.ndim == 1 else head.columns
+        return output
 
     def builder(self, head: pipeline.Segment, inner: pipeline.Segment) -> 'FullStacker.Builder':
         """Create a builder (folding context).
@@ -102,19 +120,18 @@ class FullStacker(folding.Crossvalidated):
         """
         trained: node.Worker = node.Worker(ndframe.Concat.spec(axis='columns'), len(self.bases), 1)
         applied: node.Worker = trained.fork()
-        stack_forks: typing.Iterable[node.Worker] = node.Worker.fgen(ndframe.Concat.spec(axis='index'), self.nsplits, 1)
-        merge_forks: typing.Iterable[node.Worker] = node.Worker.fgen(
-            ndframe.Apply.spec(function=self._merge), self.nsplits, 1
+        forks: typing.Sequence[typing.Tuple[topology.Composable, node.Worker, node.Worker]] = list(
+            zip(
+                self.bases,
+                node.Worker.fgen(ndframe.Concat.spec(axis='index'), self.nsplits, 1),
+                node.Worker.fgen(ndframe.Apply.spec(function=self._merge), self.nsplits, 1),
+            )
         )
-        stackers: typing.Dict[topology.Composable, node.Worker] = dict()
-        mergers: typing.Dict[topology.Composable, node.Worker] = dict()
-        for index, (base, stack, merge) in enumerate(zip(self.bases, stack_forks, merge_forks)):
-            stackers[base] = stack
-            mergers[base] = merge
-            trained[index].subscribe(stackers[base][0])
+        for index, (_, stack, merge) in enumerate(forks):
+            trained[index].subscribe(stack[0])
             applied[index].subscribe(merge[0])
 
-        return self.Builder(head, stackers, mergers, trained, applied)
+        return self.Builder(head, {b: s for b, s, _ in forks}, {b: m for b, _, m in forks}, trained, applied)
 
     def fold(
         self,
@@ -36,6 +36,8 @@ class MergingScorer(folding.Crossvalidated):
     class Builder(folding.Crossvalidated.Builder):
         """Crossvalidation builder used as a folding context."""
 
+        __slots__ = ('outer', 'merger')
+
         def __init__(self, outer: pipeline.Segment, merger: node.Worker):
             self.outer: pipeline.Segment = outer
             self.merger: node.Worker = merger
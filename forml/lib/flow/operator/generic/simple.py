@@ -23,7 +23,7 @@ import typing
 
 from forml import error
 from forml.flow import task, pipeline
-from forml.flow.graph import node
+from forml.flow.graph import node, view
 from forml.flow.pipeline import topology
 
 
@@ -159,9 +159,10 @@ class Labeler(Base):
         Returns:
             Composed segment track.
         """
+        track: view.Path = left.train
         train: node.Future = node.Future()
         label: node.Future = node.Future()
         train[0].subscribe(applier[0])
         label[0].subscribe(applier[1])
-        applier[0].subscribe(left.train.publisher)
-        return left.use(train=left.train.extend(tail=train), label=left.train.extend(tail=label))
+        applier[0].subscribe(track.publisher)
+        return left.use(train=track.extend(tail=train), label=track.extend(tail=label))
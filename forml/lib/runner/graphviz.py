@@ -19,10 +19,12 @@
 Runtime that just renders the pipeline DAG visualization.
 """
 import logging
+import re
+import subprocess
+import threading
+import types
 import typing
 
-import graphviz as grviz
-
 from forml import conf, runtime
 from forml.io import feed as feedmod, sink as sinkmod
 from forml.runtime import code
@@ -36,6 +38,8 @@ class Runner(runtime.Runner, alias='graphviz'):
     """Graphviz based runner implementation."""
 
     FILEPATH = f'{conf.APPNAME}.dot'
+    NODE: typing.Mapping[str, str] = types.MappingProxyType({'shape': 'ellipse', 'style': 'rounded'})
+    FUNCTOR: typing.Mapping[str, str] = types.MappingProxyType({'shape': 'box', 'style': 'rounded'})
 
     def __init__(
         self,
@@ -49,13 +53,69 @@ class Runner(runtime.Runner, alias='graphviz'):
         self._filepath: str = filepath or self.FILEPATH
         self._gvkw: typing.Mapping[str, typing.Any] = gvkw
 
+    @staticmethod
+    def _quote(text: str) -> str:
+        """Quote the given text as a DOT string.
+
+        Args:
+            text: Text to be quoted.
+
+        Returns:
+            Double-quoted text with any (unescaped) inner double quotes as well as a dangling trailing backslash
+            escaped.
+        """
+        text = re.sub(r'(?<!\\)((?:\\\\)*)"', r'\1\\"', text)
+        if re.search(r'(?<!\\)(?:\\\\)*\\$', text):  # odd number of trailing backslashes would escape the quote
+            text += '\\'
+        return f'"{text}"'
+
+    @staticmethod
+    def _view(process: subprocess.Popen, path: str) -> None:
+        """Wait for the rendering process to finish and open the output in a viewer.
+
+        Args:
+            process: Native rendering process.
+            path: Rendered output file.
+        """
+        import graphviz as grviz  # pylint: disable=import-outside-toplevel
+
+        if process.wait() != 0:
+            LOGGER.error('Graphviz rendering failed with %d', process.returncode)
+            return
+        grviz.view(path)
+
     def _run(self, symbols: typing.Sequence[code.Symbol]) -> None:
+        import graphviz as grviz  # pylint: disable=import-outside-toplevel
+
         dot: grviz.Digraph = grviz.Digraph(**self._gvkw)
-        for sym in symbols:
-            attrs = dict(shape='ellipse', style='rounded')
-            if isinstance(sym.instruction, instruction.Functor):
-                attrs.update(shape='box')
-            dot.node(repr(id(sym.instruction)), repr(sym.instruction), **attrs)
-            for idx, arg in enumerate(sym.arguments):
-                dot.edge(repr(id(arg)), repr(id(sym.instruction)), label=repr(idx))
-        dot.render(self._filepath, view=True)
+        names: typing.Dict[int, str] = {
+            i: f'n{n}' for n, i in enumerate(dict.fromkeys(id(s.instruction) for s in symbols))
+        }
+        labels: typing.Sequence[str] = [str(i) for i in range(max((len(s.arguments) for s in symbols), default=0))]
+        node = ' '.join(f'{k}={v}' for k, v in self.NODE.items())
+        functor = ' '.join(f'{k}={v}' for k, v in self.FUNCTOR.items())
+
+        def statements() -> typing.Iterable[str]:
+            """Generate the preformatted DOT statements for all the nodes and edges (bypassing the per-call
+            formatting of Digraph.node() and Digraph.edge()).
+
+            Returns:
+                DOT statement lines.
+            """
+            seen: typing.Set[int] = set()
+            for sym in symbols:
+                name = names[id(sym.instruction)]
+                if id(sym.instruction) not in seen:
+                    seen.add(id(sym.instruction))
+                    attrs = functor if isinstance(sym.instruction, instruction.Functor) else node
+                    label = self._quote(repr(sym.instruction))
+                    yield f'\t{name} [label={label} {attrs}]\n'
+                for idx, arg in enumerate(sym.arguments):
+                    yield f'\t{names[id(arg)]} -> {name} [label={labels[idx]}]\n'
+
+        dot.body.extend(statements())
+        filepath = dot.save(self._filepath)  # streams the lines into the file (under the optional gvkw directory)
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [dot.engine, f'-T{dot.format}', '-O', filepath]
+        )
+        threading.Thread(target=self._view, args=(process, f'{filepath}.{dot.format}')).start()
@@ -116,15 +116,20 @@ class Assets:
         if not registry:
             registry = root.Level(persistent.Registry())
         self._generation: 'genmod.Level' = registry.get(project).get(lineage).get(generation)
+        self._project: typing.Optional['product.Descriptor'] = None
 
     @property
     def project(self) -> 'product.Descriptor':
         """Get the project descriptor.
 
+        The descriptor is loaded from the lineage artifact only upon the first access.
+
         Returns:
             Project descriptor.
         """
-        return self._generation.lineage.artifact.descriptor
+        if self._project is None:
+            self._project = self._generation.lineage.artifact.descriptor
+        return self._project
 
     @property
     def tag(self) -> 'genmod.Tag':
@@ -18,9 +18,13 @@
 """Generic assets directory.
 """
 import abc
+import bisect
+import collections
 import functools
 import logging
+import threading
 import typing
+import weakref
 
 from forml import error  # pylint: disable=unused-import; # noqa: F401
 from forml.runtime.asset import persistent
@@ -34,6 +38,8 @@ LOGGER = logging.getLogger(__name__)
 class Level(metaclass=abc.ABCMeta):
     """Abstract directory level."""
 
+    __slots__ = ('_key', '_parent', '_validated', '_path', '_hash')
+
     class Invalid(error.Invalid):
         """Indication of an invalid level."""
 
@@ -55,11 +61,79 @@ class Level(metaclass=abc.ABCMeta):
     class Listing(tuple):
         """Helper class representing a registry listing."""
 
+        __slots__ = ()
+
         class Empty(error.Missing):
             """Exception indicating empty listing."""
 
-        def __new__(cls, items: typing.Iterable['Level.Key']):
-            return super().__new__(cls, tuple(sorted(set(items))))
+        def __new__(cls, items: typing.Iterable['Level.Key'], presorted: bool = False):
+            """Create the listing instance.
+
+            Args:
+                items: Listing items.
+                presorted: Flag indicating the items are already sorted and unique (skipping the normalization).
+            """
+            return super().__new__(cls, items if presorted else sorted(set(items)))
+
+        def __contains__(self, key: 'Level.Key') -> bool:
+            """Membership test using binary search over the (sorted) listing.
+
+            Args:
+                key: Item to look up.
+
+            Returns:
+                True if the item is present.
+            """
+            try:
+                index = bisect.bisect_left(self, key)
+            except TypeError:  # key not comparable with the listing items
+                return super().__contains__(key)
+            return index < len(self) and self[index] == key
+
+        @staticmethod
+        def _merge(
+            left: 'Level.Listing', right: 'Level.Listing'
+        ) -> typing.Iterator[typing.Tuple['Level.Key', bool, bool]]:
+            """Merge-scan of two (sorted) listings.
+
+            Args:
+                left: Left listing.
+                right: Right listing.
+
+            Returns:
+                Union of the items in order each with flags of its presence in the left and right listing.
+            """
+            lidx = ridx = 0
+            while lidx < len(left) and ridx < len(right):
+                if left[lidx] < right[ridx]:
+                    yield left[lidx], True, False
+                    lidx += 1
+                elif right[ridx] < left[lidx]:
+                    yield right[ridx], False, True
+                    ridx += 1
+                else:
+                    yield left[lidx], True, True
+                    lidx += 1
+                    ridx += 1
+            for key in left[lidx:]:
+                yield key, True, False
+            for key in right[ridx:]:
+                yield key, False, True
+
+        def __and__(self, other: 'Level.Listing') -> 'Level.Listing':
+            if not isinstance(other, Level.Listing):
+                return NotImplemented
+            return self.__class__((k for k, l, r in self._merge(self, other) if l and r), presorted=True)
+
+        def __or__(self, other: 'Level.Listing') -> 'Level.Listing':
+            if not isinstance(other, Level.Listing):
+                return NotImplemented
+            return self.__class__((k for k, _, _ in self._merge(self, other)), presorted=True)
+
+        def __sub__(self, other: 'Level.Listing') -> 'Level.Listing':
+            if not isinstance(other, Level.Listing):
+                return NotImplemented
+            return self.__class__((k for k, l, r in self._merge(self, other) if l and not r), presorted=True)
 
         @property
         def last(self) -> 'Level.Key':
@@ -78,15 +152,47 @@ class Level(metaclass=abc.ABCMeta):
             key = self.Key(key)
         self._key: typing.Optional['Level.Key'] = key
         self._parent: typing.Optional[Level] = parent
+        self._validated: bool = False
+        self._path: typing.Optional[typing.Tuple] = None
+        self._hash: typing.Optional[int] = None
 
     def __repr__(self):
         return f'{self._parent}-{self.key}'
 
+    def __getstate__(self):
+        # the cached path and hash are not persisted as the hash might not be valid in another process
+        return {
+            s: getattr(self, s)
+            for c in self.__class__.__mro__
+            for s in getattr(c, '__slots__', ())
+            if s not in {'_path', '_hash'}
+        }
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._path = None
+        self._hash = None
+
     def __hash__(self):
-        return hash(self._parent) ^ hash(self.key)
+        if self._hash is None:
+            self._hash = hash(self.path)
+        return self._hash
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and other._parent == self._parent and other.key == self.key
+        # cached hashes are cheap to compare and rule out most of the non-equal levels without walking the paths
+        return isinstance(other, self.__class__) and hash(other) == hash(self) and other.path == self.path
+
+    @property
+    def path(self) -> typing.Tuple:
+        """Flat tuple of all the keys leading from the root level (inclusive) down to this level.
+
+        Returns:
+            Level path tuple.
+        """
+        if self._path is None:
+            self._path = (*self._parent.path, self.key)
+        return self._path
 
     @property
     def registry(self) -> 'persistent.Registry':
@@ -101,16 +207,20 @@ class Level(metaclass=abc.ABCMeta):
     def key(self) -> 'Level.Key':
         """Either user specified or last lazily listed level key.
 
+        The key gets validated (against the parent listing) only upon the first access.
+
         Returns:
             ID of this level.
         """
-        if self._key is None:
-            if not self._parent:
-                raise ValueError('Parent or key required')
-            LOGGER.debug("Determining implicit self key as parent's last listing")
-            self._key = self._parent.list().last
-        if self._parent and self._key not in self._parent.list():
-            raise Level.Invalid(f'Invalid level key {self._key}')
+        if not self._validated:
+            if self._key is None:
+                if not self._parent:
+                    raise ValueError('Parent or key required')
+                LOGGER.debug("Determining implicit self key as parent's last listing")
+                self._key = self._parent.list().last
+            if self._parent and self._key not in self._parent.list():
+                raise Level.Invalid(f'Invalid level key {self._key}')
+            self._validated = True
         return self._key
 
     @abc.abstractmethod
@@ -134,21 +244,66 @@ class Level(metaclass=abc.ABCMeta):
 
 
 class Cache:
-    """Helper for caching registry method calls."""
+    """Helper for caching registry method calls.
+
+    The cache is bounded (least recently used entries get evicted) and it doesn't keep the registry instances alive -
+    entries of any garbage collected registry get discarded. It is thread-safe (the registry calls themselves are
+    performed outside of the lock so concurrent misses of the same key might each call the registry).
+    """
+
+    MAXSIZE = 128
+
+    __slots__ = ('_method', '_maxsize', '_entries', '_registries', '_hits', '_misses', '_lock')
 
-    def __init__(self, method: typing.Callable):
+    def __init__(self, method: typing.Callable, maxsize: int = MAXSIZE):
         self._method: str = method.__name__
+        self._maxsize: int = maxsize
+        self._entries: typing.OrderedDict[typing.Tuple, typing.Any] = collections.OrderedDict()
+        self._registries: typing.Dict[int, weakref.finalize] = dict()
+        self._hits: int = 0
+        self._misses: int = 0
+        # reentrant as the eviction finalizers can get triggered by the garbage collector while already locked
+        self._lock: threading.RLock = threading.RLock()
 
     def __repr__(self):
         return repr(self.info)
 
-    @functools.lru_cache()
     def __call__(self, registry: 'persistent.Registry', *args, **kwargs):
-        return getattr(registry, self._method)(*args, **kwargs)
+        key = id(registry), args, frozenset(kwargs.items())
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+        value = getattr(registry, self._method)(*args, **kwargs)
+        with self._lock:
+            if id(registry) not in self._registries:
+                self._registries[id(registry)] = weakref.finalize(registry, self._evict, id(registry))
+            self._entries[key] = value
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _evict(self, registry: int) -> None:
+        """Discard all entries of the given registry.
+
+        Args:
+            registry: Id of the registry whose entries to be discarded.
+        """
+        with self._lock:
+            self._registries.pop(registry, None)
+            for key in [k for k in self._entries if k[0] == registry]:
+                del self._entries[key]
 
     def clear(self) -> None:
         """Clear the cache."""
-        self.__call__.cache_clear()  # pylint: disable=no-member
+        with self._lock:
+            for finalizer in self._registries.values():
+                finalizer.detach()
+            self._registries.clear()
+            self._entries.clear()
+            self._hits = self._misses = 0
 
     @property
     def info(self) -> functools._CacheInfo:  # pylint: disable=protected-access
@@ -157,4 +312,7 @@ class Cache:
         Returns:
             Cache info tuple.
         """
-        return self.__call__.cache_info()  # pylint: disable=no-value-for-parameter
+        with self._lock:
+            return functools._CacheInfo(  # pylint: disable=protected-access
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
@@ -207,6 +207,8 @@ STATES = directory.Cache(persistent.Registry.read)
 class Level(directory.Level):
     """Snapshot of project states in its particular training iteration."""
 
+    __slots__ = ()
+
     class Key(directory.Level.Key, int):
         """Generation key."""
 
@@ -38,6 +38,8 @@ ARTIFACTS = directory.Cache(persistent.Registry.mount)
 class Level(directory.Level):
     """Sequence of generations based on same project artifact."""
 
+    __slots__ = ()
+
     class Key(directory.Level.Key, vermod.Version):  # pylint: disable=abstract-method
         """Lineage key."""
 
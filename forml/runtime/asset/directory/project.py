@@ -35,6 +35,8 @@ LOGGER = logging.getLogger(__name__)
 class Level(directory.Level):
     """Sequence of lineages based on same project."""
 
+    __slots__ = ()
+
     class Key(directory.Level.Key, str):  # pylint: disable=abstract-method
         """Project level key."""
 
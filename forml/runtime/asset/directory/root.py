@@ -31,16 +31,12 @@ LOGGER = logging.getLogger(__name__)
 class Level(directory.Level):
     """Sequence of projects."""
 
+    __slots__ = ('_registry',)
+
     def __init__(self, registry: 'persistent.Registry'):  # pylint: disable=useless-super-delegation
         super().__init__()
         self._registry: persistent.Registry = registry
 
-    def __hash__(self):
-        return hash(self.registry)
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and other.registry == self.registry
-
     def __repr__(self):
         return repr(self._registry)
 
@@ -76,3 +72,12 @@ class Level(directory.Level):
     def key(self) -> None:
         """No key for the root."""
         return None
+
+    @property
+    def path(self) -> typing.Tuple:
+        """Root path is made of the registry instance.
+
+        Returns:
+            Root path tuple.
+        """
+        return (self._registry,)
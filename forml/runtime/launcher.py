@@ -17,9 +17,15 @@
 
 """Special runtime launchers.
 """
+import atexit
+import collections
+import itertools
 import logging
 import multiprocessing
-import queue as quemod
+from multiprocessing import managers, shared_memory
+import pickle
+import sys
+import threading
 import typing
 
 from forml import runtime
@@ -43,39 +49,163 @@ class Virtual:
     class Builder:
         """Wrapper for selected launcher parameters."""
 
+        __slots__ = ('_runner', '_registry', '_feeds', '_project', '_handlers')
+
         class Handler:
             """Actual callable as a proxy for the specific launcher callback."""
 
+            __slots__ = ('_builder', '_mode')
+
             class Sink(sinkmod.Provider):
                 """Special sink to forward the output to a multiprocessing.Queue."""
 
+                class Shared(typing.NamedTuple):
+                    """Pickled payload handed over out-of-band via a shared memory block (instead of getting
+                    serialized through the queue).
+                    """
+
+                    block: str  # name of the shared memory block
+                    sizes: typing.Tuple[int, ...]  # sizes of the pickle header and the individual raw buffers
+
+                    @classmethod
+                    def dump(cls, data: payload.Native) -> 'Virtual.Builder.Handler.Sink.Shared':
+                        """Pickle the payload into a new shared memory block.
+
+                        Args:
+                            data: Payload to be dumped.
+
+                        Returns:
+                            Shared payload instance.
+                        """
+                        buffers: typing.List[pickle.PickleBuffer] = []
+                        header = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+                        segments = [memoryview(header), *(b.raw() for b in buffers)]
+                        sizes = tuple(s.nbytes for s in segments)
+                        block = shared_memory.SharedMemory(create=True, size=sum(sizes))
+                        try:
+                            start = 0
+                            for segment, end in zip(segments, itertools.accumulate(sizes)):
+                                block.buf[start:end] = segment
+                                start = end
+                        except BaseException:
+                            block.unlink()
+                            raise
+                        finally:
+                            block.close()
+                        return cls(block.name, sizes)
+
+                    def load(self) -> payload.Native:
+                        """Reconstruct the payload from the shared memory block and release the block.
+
+                        Returns:
+                            Payload instance.
+                        """
+                        block = shared_memory.SharedMemory(self.block)
+                        try:
+                            ends = tuple(itertools.accumulate(self.sizes))
+                            header, *buffers = (bytearray(block.buf[s:e]) for s, e in zip((0, *ends), ends))
+                        finally:
+                            block.close()
+                            block.unlink()
+                        return pickle.loads(header, buffers=buffers)
+
+                    def release(self) -> None:
+                        """Release the shared memory block without loading the payload."""
+                        block = shared_memory.SharedMemory(self.block)
+                        block.close()
+                        block.unlink()
+
                 class Writer(sinkmod.Provider.Writer):
                     """Sink writer."""
 
+                    THRESHOLD = 1 << 20  # minimal payload size to be passed via shared memory
+
                     @classmethod
                     def write(cls, data: payload.Native, queue: multiprocessing.Queue) -> None:
-                        queue.put(data, block=False)
+                        if sys.getsizeof(data) < cls.THRESHOLD:  # small payloads simply get pickled by the queue
+                            queue.put(data, block=False)
+                            return
+                        shared = Virtual.Builder.Handler.Sink.Shared.dump(data)
+                        try:
+                            queue.put(shared, block=False)
+                        except BaseException:
+                            shared.release()
+                            raise
+
+            _manager: typing.Optional[managers.SyncManager] = None
+            _lock: threading.Lock = threading.Lock()
 
             def __init__(self, builder: 'Virtual.Builder', mode: property):
                 self._builder: Virtual.Builder = builder
                 self._mode: property = mode
 
+            @classmethod
+            def _queue(cls) -> multiprocessing.Queue:
+                """Create a new output queue shareable with the runner processes.
+
+                The queues are provided by a single manager lazily started upon the first use and shared by all the
+                handlers (rather than spawning a dedicated manager process for each call). The manager gets restarted
+                if found dead and it is shut down upon the interpreter exit.
+
+                Returns:
+                    Output queue.
+                """
+                with cls._lock:
+                    if not cls._manager or not cls._manager._process.is_alive():  # pylint: disable=protected-access
+                        if cls._manager:
+                            LOGGER.warning('Restarting dead launcher queue manager')
+                            atexit.unregister(cls._manager.shutdown)
+                            cls._manager.shutdown()
+                        cls._manager = multiprocessing.Manager()
+                        atexit.register(cls._manager.shutdown)
+                    manager = cls._manager
+                return manager.Queue()
+
+            @classmethod
+            def _collect(cls, output: multiprocessing.Queue, load: bool) -> typing.List[typing.Any]:
+                """Drain all the payloads from the output queue.
+
+                To be called only after the runner has finished so there are no more producers and the queue size is
+                accurate.
+
+                Args:
+                    output: Queue to be drained.
+                    load: Flag to load the shared payloads (otherwise just releasing them).
+
+                Returns:
+                    Drained payloads (empty if not loading).
+                """
+                pending = collections.deque(output.get(block=False) for _ in range(output.qsize()))
+                results = []
+                try:
+                    while load and pending:
+                        item = pending.popleft()
+                        results.append(item.load() if isinstance(item, cls.Sink.Shared) else item)
+                finally:  # releasing any shared memory blocks left unread
+                    for item in pending:
+                        if isinstance(item, cls.Sink.Shared):
+                            item.release()
+                return results
+
             def __call__(
                 self, lower: typing.Optional[kind.Native] = None, upper: typing.Optional[kind.Native] = None
             ) -> typing.Any:
-                with multiprocessing.Manager() as manager:
-                    output = manager.Queue()
+                output = self._queue()
+                try:
                     self._mode.fget(self._builder(self.Sink(queue=output)))(lower, upper)
-                    try:
-                        return output.get(block=False)
-                    except quemod.Empty:
-                        LOGGER.warning('Runner finished but sink queue empty')
-                        return None
+                except BaseException:
+                    self._collect(output, load=False)
+                    raise
+                results = self._collect(output, load=True)
+                if not results:
+                    LOGGER.warning('Runner finished but sink queue empty')
+                    return None
+                return results[0] if len(results) == 1 else results
 
-        train = property(lambda self: Virtual.Builder.Handler(self, runtime.Platform.Launcher.train))
-        apply = property(lambda self: Virtual.Builder.Handler(self, runtime.Platform.Launcher.apply))
-        eval = property(lambda self: Virtual.Builder.Handler(self, runtime.Platform.Launcher.eval))
-        tune = property(lambda self: Virtual.Builder.Handler(self, runtime.Platform.Launcher.tune))
+        train = property(lambda self: self._handler(runtime.Platform.Launcher.train))
+        apply = property(lambda self: self._handler(runtime.Platform.Launcher.apply))
+        eval = property(lambda self: self._handler(runtime.Platform.Launcher.eval))
+        tune = property(lambda self: self._handler(runtime.Platform.Launcher.tune))
 
         def __init__(
             self,
@@ -88,6 +218,20 @@ class Virtual:
             self._registry: persistent.Registry = registry
             self._feeds: typing.Optional[typing.Iterable[typing.Union[provcfg.Feed, str, 'feedmod.Provider']]] = feeds
             self._project: str = project
+            self._handlers: typing.Dict[property, Virtual.Builder.Handler] = dict()
+
+        def _handler(self, mode: property) -> 'Virtual.Builder.Handler':
+            """Get the (memoized) handler of the given launcher mode.
+
+            Args:
+                mode: Launcher mode property.
+
+            Returns:
+                Mode handler.
+            """
+            if mode not in self._handlers:
+                self._handlers[mode] = self.Handler(self, mode)
+            return self._handlers[mode]
 
         def __call__(self, sink: sinkmod.Provider) -> 'runtime.Platform.Launcher':
             return runtime.Platform(self._runner, self._registry, self._feeds, sink).launcher(self._project)
@@ -96,12 +240,16 @@ class Virtual:
         self._project: str = package.manifest.name
         self._registry: persistent.Registry = virtual.Registry()
         root.Level(self._registry).get(self._project).put(package)
+        self._default: Virtual.Builder = self()
+        self._builders: typing.Dict[typing.Union[provcfg.Runner, str], Virtual.Builder] = dict()
 
     def __call__(
         self,
         runner: typing.Optional[typing.Union[provcfg.Runner, str]] = None,
         feeds: typing.Optional[typing.Iterable[typing.Union[provcfg.Feed, str, 'feedmod.Provider']]] = None,
     ) -> 'Virtual.Builder':
+        if isinstance(runner, str):  # resolving upfront rather than upon each launch
+            runner = provcfg.Runner.resolve(runner)
         return self.Builder(runner, self._registry, feeds, self._project)
 
     def __getitem__(self, runner: typing.Union[provcfg.Runner, str]) -> 'Virtual.Builder':
@@ -113,7 +261,9 @@ class Virtual:
         Returns:
             Launcher builder.
         """
-        return self(runner)
+        if runner not in self._builders:
+            self._builders[runner] = self(runner)
+        return self._builders[runner]
 
     def __getattr__(self, mode: str) -> 'Virtual.Builder.Mode.Handler':
         """Convenient shortcut for accessing the particular launcher mode using the `launcher.train()` syntax.
@@ -124,4 +274,6 @@ class Virtual:
         Returns:
             Callable launcher handler.
         """
-        return getattr(self(), mode)
+        if mode.startswith('_'):  # not to get into recursion (i.e. when not initialized)
+            raise AttributeError(f'Unknown attribute {mode}')
+        return getattr(self._default, mode)
@@ -18,67 +18,108 @@
 """
 Testing specification elements.
 """
-import abc
 import collections
 import enum
-import functools
 import types
 import typing
+import weakref
 
 
-class Scenario(collections.namedtuple('Scenario', 'params, input, output, exception')):
+class Scenario:
     """Test case specification."""
 
+    __slots__ = ('_params', '_input', '_output', '_exception', '_outcome', '_hash')
+
     @enum.unique
     class Outcome(enum.Enum):
         """Possible outcome type."""
 
-        INIT_RAISES = 'init-raises'
-        PLAINAPPLY_RAISES = 'plainapply-raises'
+        INIT_RAISES = 'init-raises', True
+        PLAINAPPLY_RAISES = 'plainapply-raises', True
         PLAINAPPLY_RETURNS = 'plainapply-returns'
         STATETRAIN_RAISES = 'statetrain-raises'
         STATETRAIN_RETURNS = 'statetrain-returns'
-        STATEAPPLY_RAISES = 'stateapply-raises'
+        STATEAPPLY_RAISES = 'stateapply-raises', True
         STATEAPPLY_RETURNS = 'stateapply-returns'
 
+        def __new__(cls, value: str, raises: bool = False):
+            member = object.__new__(cls)
+            member._value_ = value
+            member._raises = raises
+            return member
+
         @property
         def raises(self) -> bool:
             """True if this outcome is one of the raises."""
-            return self in {self.INIT_RAISES, self.PLAINAPPLY_RAISES, self.STATEAPPLY_RAISES}
-
-    class Digest(collections.namedtuple('Digest', 'trained, applied, raised')):
-        """Scenario combination fingerprint."""
-
-    OUTCOME = {
-        Digest(False, False, True): Outcome.INIT_RAISES,
-        Digest(False, True, True): Outcome.PLAINAPPLY_RAISES,
-        Digest(False, True, False): Outcome.PLAINAPPLY_RETURNS,
-        Digest(True, False, True): Outcome.STATETRAIN_RAISES,
-        Digest(True, False, False): Outcome.STATETRAIN_RETURNS,
-        Digest(True, True, True): Outcome.STATEAPPLY_RAISES,
-        Digest(True, True, False): Outcome.STATEAPPLY_RETURNS,
-    }
-
-    class Params(collections.namedtuple('Params', 'args, kwargs')):
+            return self._raises
+
+    # outcomes indexed by the (trained, applied, raised) bitmask
+    OUTCOME: typing.Tuple[typing.Optional[Outcome], ...] = (
+        None,
+        Outcome.INIT_RAISES,
+        Outcome.PLAINAPPLY_RETURNS,
+        Outcome.PLAINAPPLY_RAISES,
+        Outcome.STATETRAIN_RETURNS,
+        Outcome.STATETRAIN_RAISES,
+        Outcome.STATEAPPLY_RETURNS,
+        Outcome.STATEAPPLY_RAISES,
+    )
+
+    class Params:
         """Operator hyper-parameters."""
 
-        def __new__(cls, *args: typing.Any, **kwargs: typing.Any):
-            return super().__new__(cls, args, types.MappingProxyType(kwargs))
+        __slots__ = ('_args', '_kwargs', '_hash')
+
+        def __init__(self, *args: typing.Any, **kwargs: typing.Any):
+            self._args: typing.Tuple[typing.Any, ...] = args
+            self._kwargs: typing.Tuple[typing.Tuple[str, typing.Any], ...] = tuple(sorted(kwargs.items()))
+            self._hash: typing.Optional[int] = None
+
+        def __repr__(self):
+            return f'Params(args={self._args}, kwargs={dict(self._kwargs)})'
+
+        def __getstate__(self):
+            # the cached hash is not persisted as it might not be valid in another process
+            return self._args, self._kwargs
+
+        def __setstate__(self, state):
+            self._args, self._kwargs = state
+            self._hash = None
 
         def __hash__(self):
-            return hash(self.args) ^ hash(tuple(sorted(self.kwargs.items())))
+            if self._hash is None:  # computed lazily as the params might not be hashable
+                self._hash = hash((self._args, self._kwargs))
+            return self._hash
 
-    class IO(metaclass=abc.ABCMeta):
-        """Input/output base class."""
+        def __eq__(self, other: typing.Any):
+            # pylint: disable=protected-access
+            return isinstance(other, self.__class__) and self._args == other._args and self._kwargs == other._kwargs
+
+        @property
+        def args(self) -> typing.Tuple[typing.Any, ...]:
+            """Positional hyper-parameters.
+
+            Returns:
+                Tuple of positional args.
+            """
+            return self._args
 
         @property
-        @abc.abstractmethod
-        def apply(self) -> typing.Any:
-            """Apply dataset.
+        def kwargs(self) -> typing.Mapping[str, typing.Any]:
+            """Keyword hyper-parameters.
 
             Returns:
-                The apply dataset.
+                Read-only mapping of keyword args.
             """
+            return types.MappingProxyType(dict(self._kwargs))
+
+    class IO:
+        """Input/output base mixin (requiring the apply field and the trained property on the actual type)."""
+
+        __slots__ = ()
+
+        apply: typing.Any  # apply dataset
+        trained: bool  # test this is a (to-be) trained in/output
 
         def __bool__(self):
             return self.applied or self.trained
@@ -88,14 +129,11 @@ class Scenario(collections.namedtuple('Scenario', 'params, input, output, except
             """Test this is a (to-be) applied in/output."""
             return self.apply is not None
 
-        @property
-        @abc.abstractmethod
-        def trained(self) -> bool:
-            """Test this is a to-be trained in/output."""
-
     class Input(collections.namedtuple('Input', 'apply, train, label'), IO):
         """Input data type."""
 
+        __slots__ = ()
+
         def __new__(cls, apply: typing.Any = None, train: typing.Any = None, label: typing.Any = None):
             return super().__new__(cls, apply, train, label)
 
@@ -107,6 +145,8 @@ class Scenario(collections.namedtuple('Scenario', 'params, input, output, except
     class Output(collections.namedtuple('Output', 'apply, train, matcher'), IO):
         """Output data type."""
 
+        __slots__ = ()
+
         def __new__(
             cls,
             apply: typing.Any = None,
@@ -134,50 +174,127 @@ class Scenario(collections.namedtuple('Scenario', 'params, input, output, except
     class Exception(collections.namedtuple('Exception', 'kind, message')):
         """Exception type."""
 
+        __slots__ = ()
+        _VALID: typing.MutableSet[typing.Type[Exception]] = weakref.WeakSet()  # already validated kinds
+
         def __new__(cls, kind: typing.Type[Exception], message: typing.Optional[str] = None):
-            if not issubclass(kind, Exception):
-                raise ValueError('Invalid exception type')
+            if kind not in cls._VALID:
+                if not issubclass(kind, Exception):
+                    raise ValueError('Invalid exception type')
+                cls._VALID.add(kind)
             return super().__new__(cls, kind, message)
 
-    def __new__(
-        cls,
+    # shared instances of the (immutable) empty in/outputs
+    _EMPTY_INPUT: 'Scenario.Input' = Input()
+    _EMPTY_OUTPUT: 'Scenario.Output' = Output()
+
+    def __init__(
+        self,
         params: 'Scenario.Params',
         input: typing.Optional['Scenario.Input'] = None,  # pylint: disable=redefined-builtin
         output: typing.Optional['Scenario.Output'] = None,
-        exception: typing.Optional[typing.Type[Exception]] = None,
+        exception: typing.Optional['Scenario.Exception'] = None,
     ):
         if not output:
-            output = cls.Output()
+            output = self._EMPTY_OUTPUT
         if not input:
-            input = cls.Input()
-            if output:
+            input = self._EMPTY_INPUT
+            if output is not self._EMPTY_OUTPUT:
                 raise ValueError('Output without input')
             if not exception:
                 raise ValueError('Unknown outcome')
-        return super().__new__(cls, params, input, output, exception)
+        self._params: Scenario.Params = params
+        self._input: Scenario.Input = input
+        self._output: Scenario.Output = output
+        self._exception: typing.Optional[Scenario.Exception] = exception
+        self._outcome: Scenario.Outcome = self.OUTCOME[
+            input.trained << 2 | input.applied << 1 | (exception is not None)
+        ]
+        self._hash: typing.Optional[int] = None
+
+    def __getstate__(self):
+        # the cached hash is not persisted as it might not be valid in another process
+        return self._params, self._input, self._output, self._exception, self._outcome
+
+    def __setstate__(self, state):
+        self._params, self._input, self._output, self._exception, self._outcome = state
+        self._hash = None
+
+    def __repr__(self):
+        return (
+            f'Scenario(params={self._params}, input={self._input}, output={self._output}, '
+            f'exception={self._exception})'
+        )
 
     def __hash__(self):
-        return hash(self.params) ^ hash(self.input.trained) ^ hash(self.input.applied) ^ hash(self.exception)
+        if self._hash is None:  # the outcome already captures the trained/applied input flags
+            self._hash = hash(self._params) ^ hash(self._outcome) ^ hash(self._exception)
+        return self._hash
+
+    def __eq__(self, other: typing.Any):
+        # pylint: disable=protected-access
+        return (
+            isinstance(other, self.__class__)
+            and self._params == other._params
+            and self._input == other._input
+            and self._output == other._output
+            and self._exception == other._exception
+        )
+
+    @property
+    def params(self) -> 'Scenario.Params':
+        """Operator hyper-parameters.
+
+        Returns:
+            Params instance.
+        """
+        return self._params
+
+    @property
+    def input(self) -> 'Scenario.Input':
+        """Input datasets.
+
+        Returns:
+            Input instance.
+        """
+        return self._input
+
+    @property
+    def output(self) -> 'Scenario.Output':
+        """Expected output.
+
+        Returns:
+            Output instance.
+        """
+        return self._output
+
+    @property
+    def exception(self) -> typing.Optional['Scenario.Exception']:
+        """Expected exception.
+
+        Returns:
+            Exception instance if raising scenario.
+        """
+        return self._exception
 
     @property
-    @functools.lru_cache()
     def outcome(self) -> 'Scenario.Outcome':
         """The outcome type of this scenario.
 
         Returns:
             Outcome type.
         """
-        return self.OUTCOME[self.Digest(self.input.trained, self.input.applied, self.exception is not None)]
+        return self._outcome
 
 
 class Raisable:
     """Base outcome type allowing a raising assertion."""
 
     def __init__(
-        self, params: 'Scenario.Params', input: typing.Optional['Scenario.IO'] = None
+        self, params: 'Scenario.Params', input: typing.Optional['Scenario.Input'] = None
     ):  # pylint: disable=redefined-builtin
         self._params: Scenario.Params = params
-        self._input: Scenario.Input = input or Scenario.Input()
+        self._input: Scenario.Input = input or Scenario._EMPTY_INPUT  # pylint: disable=protected-access
 
     def raises(self, kind: typing.Type[Exception], message: typing.Optional[str] = None) -> Scenario:
         """Assertion on expected exception."""
@@ -191,7 +308,8 @@ class Applied(Raisable):
         self, output: typing.Any, matcher: typing.Optional[typing.Callable[[typing.Any, typing.Any], bool]] = None
     ) -> Scenario:
         """Assertion on expected return value."""
-        return Scenario(self._params, self._input, Scenario.Output(apply=output, matcher=matcher))
+        # bypassing the (apply/train collision) validation using _make as only the apply output is set
+        return Scenario(self._params, self._input, Scenario.Output._make((output, None, matcher)))
 
 
 class Appliable(Raisable):
@@ -199,7 +317,7 @@ class Appliable(Raisable):
 
     def apply(self, features: typing.Any) -> Applied:
         """Apply input dataset definition."""
-        return Applied(self._params, self._input._replace(apply=features))
+        return Applied(self._params, Scenario.Input(features, self._input.train, self._input.label))
 
 
 class Trained(Appliable):
@@ -209,4 +327,5 @@ class Trained(Appliable):
         self, output: typing.Any, matcher: typing.Optional[typing.Callable[[typing.Any, typing.Any], bool]] = None
     ) -> Scenario:
         """Assertion on expected return value."""
-        return Scenario(self._params, self._input, Scenario.Output(train=output, matcher=matcher))
+        # bypassing the (apply/train collision) validation using _make as only the train output is set
+        return Scenario(self._params, self._input, Scenario.Output._make((None, output, matcher)))
@@ -28,36 +28,42 @@ from forml.flow.graph import node
 from forml.flow.pipeline import topology
 
 
-@pytest.fixture(scope='function')
-def operator(spec: task.Spec) -> topology.Operator:
-    """Operator fixture."""
+class Operator(topology.Operator):
+    """Operator mock."""
 
-    class Operator(topology.Operator):
-        """Operator mock."""
+    def __init__(self, spec: task.Spec):
+        self._spec: task.Spec = spec
 
-        def compose(self, left: topology.Composable) -> pipeline.Segment:
-            """Dummy composition."""
-            track = left.expand()
-            trainer = node.Worker(spec, 1, 1)
-            applier = trainer.fork()
-            extractor = node.Worker(spec, 1, 1)
-            trainer.train(track.train.publisher, extractor[0])
-            return track.use(label=track.train.extend(extractor)).extend(applier)
+    def compose(self, left: topology.Composable) -> pipeline.Segment:
+        """Dummy composition."""
+        track = left.expand()
+        trainer = node.Worker(self._spec, 1, 1)
+        applier = trainer.fork()
+        extractor = node.Worker(self._spec, 1, 1)
+        trainer.train(track.train.publisher, extractor[0])
+        return track.use(label=track.train.extend(extractor)).extend(applier)
 
-    return Operator()
 
+class Origin(topology.Operator):
+    """Origin operator mock."""
 
-@pytest.fixture(scope='function')
-def origin(spec: task.Spec) -> topology.Operator:
-    """Origin operator fixture."""
+    def __init__(self, spec: task.Spec):
+        self._spec: task.Spec = spec
+
+    def compose(self, left: topology.Composable) -> pipeline.Segment:
+        """Dummy composition."""
+        trainer = node.Worker(self._spec, 1, 1)
+        applier = trainer.fork()
+        return pipeline.Segment(applier, trainer)
 
-    class Operator(topology.Operator):
-        """Operator mock."""
 
-        def compose(self, left: topology.Composable) -> pipeline.Segment:
-            """Dummy composition."""
-            trainer = node.Worker(spec, 1, 1)
-            applier = trainer.fork()
-            return pipeline.Segment(applier, trainer)
+@pytest.fixture(scope='function')
+def operator(spec: task.Spec) -> topology.Operator:
+    """Operator fixture."""
+    return Operator(spec)
+
 
-    return Operator()
+@pytest.fixture(scope='function')
+def origin(spec: task.Spec) -> topology.Operator:
+    """Origin operator fixture."""
+    return Origin(spec)
@@ -56,6 +56,16 @@ class TestContainer:
             with storage:
                 storage.context.symbols.push(value)
 
+    def test_pull(self, storage, value):
+        """Test multi-value stack retrieval."""
+        with storage:
+            storage.context.symbols.push(1)
+            storage.context.symbols.push(value)
+            assert storage.context.symbols.pull(0) == []
+            with pytest.raises(RuntimeError):
+                storage.context.symbols.pull(3)
+            assert storage.context.symbols.pull(2) == [1, value]
+
 
 class Frame(parsmod.Frame[tuple, tuple]):  # pylint: disable=unsubscriptable-object
     """Dummy frame parser wrapping all terms into tuples."""
@@ -144,3 +154,9 @@ class TestParser(TupleParser):
     def parser(sources: typing.Mapping[framod.Source, tuple], columns: typing.Mapping[sermod.Column, tuple]) -> Frame:
         """Parser fixture."""
         return Frame(sources, columns)
+
+    def test_generate_column(self, parser: Frame, student: framod.Table):
+        """Test the column generation caching."""
+        column = student.score + 1
+        assert parser.generate_column(column) is parser.generate_column(student.score + 1)
+        assert parser.generate_column(student.score) == ((student,), (student.score,))
@@ -24,6 +24,28 @@ from forml.flow import task
 from forml.lib.flow.actor import wrapped
 
 
+class Model:
+    """Stateful actor to-be wrapped class."""
+
+    def __init__(self):
+        self.model = None
+
+    def fit(self, features, labels):
+        """Actor train implementation."""
+        self.model = (features, labels)
+
+    def predict(self, features):  # pylint: disable=unused-argument
+        """Actor apply implementation."""
+        return self.model
+
+    def get_params(self):
+        """Params getter."""
+        return {}
+
+    def set_params(self):
+        """Params setter."""
+
+
 class TestFunction:
     """Wrapped function unit tests."""
 
@@ -48,3 +70,54 @@ class TestFunction:
     def test_apply(self, actor: task.Actor):
         """Actor applying test."""
         assert actor(old='baz', new='foo').apply('baz bar') == 'foo bar'
+
+
+class TestClass:
+    """Wrapped class unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def actor() -> task.Actor:
+        """Actor fixture."""
+
+        @wrapped.Class.actor(apply='predict')
+        class Replace:
+            """Actor wrapped class."""
+
+            def __init__(self, new: str):
+                self.new = new
+
+            def predict(self, string: str) -> str:
+                """Actor apply implementation."""
+                return string.replace('baz', self.new)
+
+            def get_params(self):
+                """Params getter."""
+                return {'new': self.new}
+
+            def set_params(self, new: str):
+                """Params setter."""
+                self.new = new
+
+        return Replace
+
+    def test_delegation(self, actor: task.Actor):
+        """Test the attribute delegation to the wrapped instance."""
+        instance = actor(new='foo')
+        assert instance.apply('baz bar') == 'foo bar'
+        assert instance.new == 'foo'
+        assert not instance.is_stateful()
+        with pytest.raises(AttributeError):
+            instance.train  # pylint: disable=pointless-statement
+
+    def test_state(self):
+        """Test the wrapped actor state doesn't capture any wrapping internals."""
+        actor = wrapped.Class.actor(Model, apply='predict', train='fit')
+        assert hash(actor) == hash(wrapped.Class.actor(Model, apply='predict', train='fit'))
+        trained = actor()
+        assert trained.is_stateful()
+        trained.train('foo', 'bar')
+        restored = actor()
+        restored.set_state(trained.get_state())
+        assert restored.apply(None) == ('foo', 'bar')
+        assert set(restored.__dict__) == {'_actor', '_params'}
@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Ensemble operator unit tests.
+"""
+# pylint: disable=no-self-use
+import numpy
+import pandas
+import pytest
+
+from forml.lib.flow.operator.folding import ensemble
+
+
+class TestFullStacker:
+    """Full stacker unit tests."""
+
+    def test_merge(self):
+        """Test the fold predictions merging."""
+        index = pandas.Index([3, 1, 2])
+        series = [
+            pandas.Series([1.0, 2.0, 3.0], index=index, name='foo'),
+            pandas.Series([3.0, 4.0, 5.0], index=index, name='bar'),
+        ]
+        pandas.testing.assert_frame_equal(
+            ensemble.FullStacker._merge(*series),  # pylint: disable=protected-access
+            pandas.DataFrame({'foo': [2.0, 3.0, 4.0]}, index=index),
+        )
+        frames = [
+            pandas.DataFrame({'a': [1.0, 2.0], 'b': [5.0, None]}),
+            pandas.DataFrame({'a': [3.0, 6.0], 'b': [7.0, None]}),
+        ]
+        pandas.testing.assert_frame_equal(
+            ensemble.FullStacker._merge(*frames),  # pylint: disable=protected-access
+            pandas.DataFrame({'a': [2.0, 4.0], 'b': [6.0, None]}),
+        )
+        with pytest.raises(ValueError):
+            ensemble.FullStacker._merge(*series, frames[0])  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize(
+        'kind, expected',
+        [
+            ('bool', 'float64'),
+            ('int8', 'float64'),
+            ('int64', 'float64'),
+            ('float32', 'float32'),
+            ('float64', 'float64'),
+        ],
+    )
+    def test_merge_dtype(self, kind: str, expected: str):
+        """Test the merged predictions type."""
+        folds = [pandas.Series(numpy.array(v, dtype=kind), name='foo') for v in ([1, 0, 1], [1, 1, 0])]
+        merged = ensemble.FullStacker._merge(*folds)  # pylint: disable=protected-access
+        assert merged['foo'].dtype == expected
+        assert merged['foo'].tolist() == [1.0, 0.5, 0.5]
+
+    def test_merge_mixed(self):
+        """Test merging frames with columns of different types."""
+        frame = pandas.DataFrame({'a': numpy.array([1, 2], dtype='float32'), 'b': [2**40 + 1, 2]})
+        merged = ensemble.FullStacker._merge(frame, frame)  # pylint: disable=protected-access
+        assert merged.dtypes.tolist() == [numpy.float32, numpy.float64]
+        assert merged['b'].tolist() == [2**40 + 1, 2]
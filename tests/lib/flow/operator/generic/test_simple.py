@@ -40,3 +40,17 @@ class TestMapper:
     def test_compose(self, operator: topology.Operator):
         """Operator composition test."""
         operator.compose(topology.Origin())
+
+    def test_spec(self, actor: typing.Type[task.Actor]):
+        """Test the operator spec params."""
+        # pylint: disable=no-value-for-parameter,unexpected-keyword-arg
+        factory = simple.Mapper.operator(actor)
+        assert factory(1, foo='bar').spec == factory(1, foo='bar').spec
+        assert factory(1).spec.args[0] is not True and factory(True).spec.args[0] is True
+        assert isinstance(factory(foo=(1.0,)).spec.kwargs['foo'][0], float)
+        assert isinstance(factory(foo=(1,)).spec.kwargs['foo'][0], int)
+        assert (
+            factory(foo=(1, 2)).spec.kwargs['foo'][0] is not True
+            and factory(foo=(True, 2)).spec.kwargs['foo'][0] is True
+        )
+        assert factory(foo=['bar']).spec.kwargs['foo'] == ['bar']
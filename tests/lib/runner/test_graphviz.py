@@ -0,0 +1,81 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Graphviz runner unit tests.
+"""
+# pylint: disable=no-self-use,protected-access
+import pathlib
+import subprocess
+from unittest import mock
+
+import pytest
+
+from forml.flow import task
+from forml.lib.runner import graphviz
+from forml.runtime import code
+from forml.runtime.code import instruction
+
+
+class TestRunner:
+    """Graphviz runner unit tests."""
+
+    def test_quote(self):
+        """Test the DOT string quoting."""
+        assert graphviz.Runner._quote('foo') == '"foo"'
+        assert graphviz.Runner._quote('a "b" \\"c') == '"a \\"b\\" \\"c"'
+        assert graphviz.Runner._quote('sep=\'\\\\"\'') == '"sep=\'\\\\\\"\'"'
+        assert graphviz.Runner._quote('foo\\') == '"foo\\\\"'
+        assert graphviz.Runner._quote('foo\\\\') == '"foo\\\\"'
+        assert graphviz.Runner._quote('foo\\\\\\') == '"foo\\\\\\\\"'
+
+    def test_run(self, spec: task.Spec, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        """Test rendering a simple DAG."""
+        popen = mock.MagicMock()
+        monkeypatch.setattr(subprocess, 'Popen', popen)
+        monkeypatch.setattr(graphviz.Runner, '_view', staticmethod(lambda *_: None))
+        source = instruction.Getter(0)
+        functor = instruction.Mapper(spec)
+        sink = instruction.Getter(1)
+        symbols = [code.Symbol(source), code.Symbol(functor, [source]), code.Symbol(sink, [functor, source])]
+        filepath = tmp_path / 'pipeline.dot'
+        graphviz.Runner(mock.MagicMock(), mock.MagicMock(), filepath=str(filepath))._run(symbols)
+        assert filepath.read_text() == (
+            'digraph {\n'
+            '\tn0 [label="Getter#0" shape=ellipse style=rounded]\n'
+            f'\tn1 [label="{spec!r}" shape=box style=rounded]\n'
+            '\tn0 -> n1 [label=0]\n'
+            '\tn2 [label="Getter#1" shape=ellipse style=rounded]\n'
+            '\tn1 -> n2 [label=0]\n'
+            '\tn0 -> n2 [label=1]\n'
+            '}\n'
+        )
+        popen.assert_called_once_with(['dot', '-Tpdf', '-O', str(filepath)])
+
+    def test_directory(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        """Test the output gets placed into the user specified directory."""
+        popen = mock.MagicMock()
+        monkeypatch.setattr(subprocess, 'Popen', popen)
+        thread = mock.MagicMock()
+        monkeypatch.setattr(graphviz.threading, 'Thread', thread)
+        source = instruction.Getter(0)
+        runner = graphviz.Runner(mock.MagicMock(), mock.MagicMock(), filepath='pipeline.dot', directory=tmp_path)
+        runner._run([code.Symbol(source)])
+        filepath = tmp_path / 'pipeline.dot'
+        assert filepath.read_text() == 'digraph {\n\tn0 [label="Getter#0" shape=ellipse style=rounded]\n}\n'
+        popen.assert_called_once_with(['dot', '-Tpdf', '-O', str(filepath)])
+        thread.assert_called_once_with(target=graphviz.Runner._view, args=(popen.return_value, f'{filepath}.pdf'))
@@ -19,10 +19,76 @@
 ForML asset directory unit tests.
 """
 # pylint: disable=no-self-use
+import os
+import pathlib
+import pickle
+import subprocess
+import sys
+import threading
+
 import pytest
 
 from forml.runtime.asset import directory, persistent
+from forml.lib.registry import filesystem
 from forml.runtime.asset.directory import project as prjmod, lineage as lngmod, generation as genmod
+from forml.runtime.asset.directory import root
+
+
+class TestListing:
+    """Directory listing tests."""
+
+    def test_contains(self):
+        """Test the listing membership."""
+        listing = directory.Level.Listing(genmod.Level.Key(k) for k in (3, 1, 2, 3))
+        assert listing == (1, 2, 3)
+        assert genmod.Level.Key(2) in listing
+        assert 4 not in listing
+        assert 'foo' not in listing
+        assert 2 not in directory.Level.Listing([])
+
+    def test_presorted(self):
+        """Test the listing of presorted items."""
+        assert directory.Level.Listing(iter([1, 2, 3]), presorted=True) == (1, 2, 3)
+
+    def test_setops(self):
+        """Test the listing set operations."""
+        left = directory.Level.Listing([1, 3, 4, 6])
+        right = directory.Level.Listing([2, 3, 6, 7])
+        assert isinstance(left & right, directory.Level.Listing)
+        assert left & right == (3, 6)
+        assert left | right == (1, 2, 3, 4, 6, 7)
+        assert left - right == (1, 4)
+        assert right - left == (2, 7)
+        assert left - directory.Level.Listing([]) == left
+        with pytest.raises(TypeError):
+            left & {1}  # pylint: disable=pointless-statement
+
+
+class TestLevel:
+    """Directory level tests."""
+
+    PICKLER = """
+import pickle, sys
+from forml.runtime.asset.directory import root
+from forml.lib.registry import filesystem
+level = root.Level(filesystem.Registry(sys.argv[1]))
+hash(level)
+sys.stdout.buffer.write(pickle.dumps(level))
+"""
+
+    def test_serializable(self, tmp_path: pathlib.Path):
+        """Test the level unpickled from another process (different hash seed) still matches the local one."""
+        level = root.Level(filesystem.Registry(tmp_path))
+        hash(level)
+        seed = '2' if os.environ.get('PYTHONHASHSEED') == '1' else '1'
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        pickled = subprocess.run(
+            [sys.executable, '-c', self.PICKLER, str(tmp_path)], env=env, check=True, capture_output=True
+        ).stdout
+        restored = pickle.loads(pickled)
+        assert restored == level and level == restored
+        assert hash(restored) == hash(level)
+        assert restored in {level}
 
 
 class TestCache:
@@ -54,3 +120,47 @@ class TestCache:
         assert cache.info.hits == 1
         cache.clear()
         assert cache.info.currsize == 0
+
+    def test_eviction(self, cache: directory.Cache):
+        """Test the registry entries are discarded once the registry is gone."""
+
+        class Registry:
+            """Dummy registry."""
+
+            def open(self, *args):  # pylint: disable=missing-function-docstring
+                return args
+
+        registry = Registry()
+        assert cache(registry, 1) == (1,)
+        assert cache.info.currsize == 1
+        del registry
+        assert cache.info.currsize == 0
+
+    def test_threads(self, cache: directory.Cache):
+        """Test concurrent access to the cache."""
+
+        class Registry:
+            """Dummy registry."""
+
+            def open(self, *args):  # pylint: disable=missing-function-docstring
+                return args
+
+        registry = Registry()
+        invalid = []
+
+        def worker(offset: int) -> None:
+            """Cache hammering worker."""
+            for i in range(1000):
+                key = (i + offset) % (2 * cache.info.maxsize)
+                if cache(registry, key) != (key,):
+                    invalid.append(key)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not invalid
+        info = cache.info
+        assert info.hits + info.misses == 8000
+        assert info.currsize == info.maxsize
@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML launcher unit tests.
+"""
+# pylint: disable=no-self-use,protected-access
+import multiprocessing
+import queue
+import threading
+import typing
+from multiprocessing import managers, shared_memory
+
+import numpy
+import pytest
+
+from forml.runtime import launcher
+
+Handler = launcher.Virtual.Builder.Handler
+MODE = property(lambda launcher: launcher)  # mode mock passing the launcher itself
+
+
+class TestSink:
+    """Virtual launcher sink unit tests."""
+
+    def test_small(self):
+        """Test small payloads are passed directly."""
+        output = queue.Queue()
+        Handler.Sink.Writer.write([1, 2, 3], output)
+        assert output.get(block=False) == [1, 2, 3]
+
+    def test_shared(self):
+        """Test large payloads are passed via shared memory."""
+        data = numpy.random.rand(Handler.Sink.Writer.THRESHOLD // 8 + 1)
+        output = queue.Queue()
+        Handler.Sink.Writer.write(data, output)
+        shared = output.get(block=False)
+        assert isinstance(shared, Handler.Sink.Shared)
+        assert (shared.load() == data).all()
+        with pytest.raises(FileNotFoundError):  # released upon loading
+            shared_memory.SharedMemory(shared.block)
+
+
+class TestHandler:
+    """Virtual launcher handler unit tests."""
+
+    class Builder:
+        """Builder mock running the given writer."""
+
+        def __init__(self, writer: typing.Callable[[queue.Queue], None]):
+            self._writer: typing.Callable[[queue.Queue], None] = writer
+
+        def __call__(self, sink: Handler.Sink) -> typing.Callable[[typing.Any, typing.Any], None]:
+            return lambda lower, upper: self._writer(sink._writerkw['queue'])
+
+    def test_call(self):
+        """Test collecting both the plain and shared payloads."""
+        data = numpy.random.rand(Handler.Sink.Writer.THRESHOLD // 8 + 1)
+
+        def writer(output: queue.Queue) -> None:
+            """Writing the outputs."""
+            Handler.Sink.Writer.write('foo', output)
+            Handler.Sink.Writer.write(data, output)
+
+        result = Handler(self.Builder(writer), MODE)()
+        assert result[0] == 'foo'
+        assert (result[1] == data).all()
+
+    def test_error(self):
+        """Test any unread shared payloads get released upon runner error."""
+        blocks = []
+
+        def writer(output: queue.Queue) -> None:
+            """Writing an output and failing."""
+            shared = Handler.Sink.Shared.dump(numpy.random.rand(10))
+            blocks.append(shared.block)
+            output.put(shared)
+            raise RuntimeError('Runner failed')
+
+        with pytest.raises(RuntimeError, match='Runner failed'):
+            Handler(self.Builder(writer), MODE)()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(blocks[0])
+
+    def test_manager(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the queue manager gets started just once even if concurrently and restarted if dead."""
+        started = []
+        factory = multiprocessing.Manager
+
+        def manager() -> managers.SyncManager:
+            """Manager factory mock tracking the started instances."""
+            instance = factory()
+            started.append(instance)
+            return instance
+
+        monkeypatch.setattr(Handler, '_manager', None)
+        monkeypatch.setattr(multiprocessing, 'Manager', manager)
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            """Concurrent queue requester."""
+            barrier.wait()
+            Handler._queue()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            assert len(started) == 1
+            started[0]._process.terminate()
+            started[0]._process.join()
+            output = Handler._queue()
+            output.put('foo')
+            assert output.get() == 'foo'
+            assert len(started) == 2 and Handler._manager is started[1]
+        finally:
+            for instance in started:
+                instance.shutdown()
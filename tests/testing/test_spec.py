@@ -20,14 +20,48 @@ ForML testing spec unit tests.
 """
 # pylint: disable=protected-access,no-self-use
 
+import copy
+import pickle
 import typing
 
 from forml.testing import spec
 
 
+class TestParams:
+    """Scenario params unit tests."""
+
+    def test_identity(self, hyperparams: typing.Mapping[str, int]):
+        """Test the params equality and hashing."""
+        params = spec.Scenario.Params(1, **hyperparams)
+        assert params.args == (1,)
+        assert params.kwargs == hyperparams
+        same = spec.Scenario.Params(1, **dict(reversed(list(hyperparams.items()))))
+        assert params == same
+        assert hash(params) == hash(same)
+        assert params != spec.Scenario.Params(**hyperparams)
+
+
 class TestScenario:
     """Testing Case unit tests."""
 
+    def test_serializable(self, stateapply_returns: spec.Scenario):
+        """Test the scenario can be pickled and copied."""
+        restored = pickle.loads(pickle.dumps(stateapply_returns))
+        assert restored == stateapply_returns
+        assert hash(restored) == hash(stateapply_returns)
+        assert restored.outcome == stateapply_returns.outcome
+        assert restored.params.kwargs == stateapply_returns.params.kwargs
+        assert copy.copy(stateapply_returns) == stateapply_returns
+
+    def test_outcome(self):
+        """Test the outcome flags."""
+        assert {o for o in spec.Scenario.Outcome if o.raises} == {
+            spec.Scenario.Outcome.INIT_RAISES,
+            spec.Scenario.Outcome.PLAINAPPLY_RAISES,
+            spec.Scenario.Outcome.STATEAPPLY_RAISES,
+        }
+        assert spec.Scenario.Outcome('statetrain-raises') is spec.Scenario.Outcome.STATETRAIN_RAISES
+
     def test_init_raises(self, init_raises: spec.Scenario, hyperparams: typing.Mapping[str, int], exception: Exception):
         """Scenario spec test case."""
         assert init_raises.outcome == spec.Scenario.Outcome.INIT_RAISES